@@ -10,49 +10,101 @@ Diagnostic output goes to stderr.
 """
 
 import argparse
-import json
+import mmap
+import os
 import re
 import sys
 
-
-def check_no_discount(text):
-    """Return True if page has at least one discounted product."""
-    # Match "XX% OFF" pattern used by 2ndStreet
-    discounts = re.findall(r'\d+%\s*OFF', text, re.IGNORECASE)
-    count = len(discounts)
+try:
+    import ijson  # optional: streams product URLs out of latest.json
+except ImportError:
+    ijson = None
+
+# Page patterns run as bytes regexes over the mapped file. Bytes \s is ASCII-only,
+# so the UTF-8 encodings of the other whitespace str \s matches (NBSP, U+1680,
+# U+2000-200A, U+2028/2029, U+202F, U+205F, ideographic space) are spelled out.
+_NON_ASCII_WS = rb'\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80'
+_WS = rb'(?:[\s\x1c-\x1f]|' + _NON_ASCII_WS + rb')'
+# Bytes \d is ASCII-only too; also accept full-width digits (U+FF10-FF19)
+_DIGIT = rb'(?:\d|\xef\xbc[\x90-\x99])'
+# Match "XX% OFF" pattern used by 2ndStreet
+_DISCOUNT_FIND_RE = re.compile(_DIGIT + rb'+%' + _WS + rb'*OFF', re.IGNORECASE)
+_2NDST_URL_FIND_RE = re.compile(
+    rb'https://en\.2ndstreet\.jp/goods/detail/(?:(?!' + _NON_ASCII_WS + rb')[^\s\x1c-\x1f\)\]])+'
+)
+_LATEST_URL_RE = re.compile(r'"url":\s*"([^"]+)"')
+
+_JSON_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+
+def _load_known_urls(latest_path):
+    """Return the set of product URLs in latest.json without loading every product."""
+    if ijson is not None:
+        with open(latest_path, 'rb') as f:
+            return set(ijson.items(f, 'products.item.url'))
+    # latest.json is our own output, so a regex over the raw text is safe once
+    # the file is known to be complete; corrupt files take the usual error path
+    with open(latest_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if '"products"' not in text or not text.rstrip().endswith('}'):
+        raise ValueError('not a complete results file (missing "products" or closing brace)')
+    return set(_LATEST_URL_RE.findall(text))
+
+
+def _map_file(path):
+    """Return the file's contents as a read-only mmap (b'' for an empty file)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''  # empty files cannot be mapped
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def check_no_discount(data):
+    """Return True if page has at least one discounted product.
+
+    data is the raw page bytes (bytes or mmap).
+    """
+    count = sum(1 for _ in _DISCOUNT_FIND_RE.finditer(data))
     print(f"  page_checker: no_discount — found {count} discounted items", file=sys.stderr)
     return count > 0
 
 
-def check_seen_before(text, latest_path, threshold):
-    """Return True if page has enough new (unseen) products to continue."""
-    # Extract product URLs from page
-    page_urls = set(re.findall(
-        r'https://en\.2ndstreet\.jp/goods/detail/[^\s\)\]]+', text
-    ))
+def check_seen_before(data, latest_path, threshold):
+    """Return True if page has enough new (unseen) products to continue.
+
+    data is the raw page bytes (bytes or mmap).
+    """
+    # Extract product URLs from page, decoding each URL rather than the whole page
+    page_urls = {url.decode('utf-8', 'replace') for url in _2NDST_URL_FIND_RE.findall(data)}
     if not page_urls:
         print("  page_checker: seen_before — no product URLs found on page", file=sys.stderr)
         return False  # no products = stop
 
     # Load known URLs from latest.json
-    known_urls = set()
     try:
-        with open(latest_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        for p in data.get('products', []):
-            known_urls.add(p.get('url', ''))
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        known_urls = _load_known_urls(latest_path)
+    except (FileNotFoundError, *_JSON_ERRORS) as e:
         print(f"  page_checker: seen_before — could not load {latest_path}: {e}", file=sys.stderr)
         return True  # can't check = keep going
 
-    overlap = page_urls & known_urls
-    ratio = len(overlap) / len(page_urls) if page_urls else 0
+    # Probe URLs until the outcome is decided: stop once the known ratio reaches
+    # the threshold, continue once the remaining URLs can no longer reach it
+    total = len(page_urls)
+    hits = 0
+    for checked, url in enumerate(page_urls, 1):
+        hits += url in known_urls
+        if hits / total >= threshold:
+            should_continue = False
+            break
+        if (hits + total - checked) / total < threshold:
+            should_continue = True
+            break
     print(
-        f"  page_checker: seen_before — {len(overlap)}/{len(page_urls)} URLs already known "
-        f"({ratio:.0%}, threshold {threshold:.0%})",
+        f"  page_checker: seen_before — {hits}/{checked} checked URLs already known "
+        f"of {total} on page (threshold {threshold:.0%})",
         file=sys.stderr,
     )
-    return ratio < threshold  # continue if overlap is below threshold
+    return should_continue  # continue if overlap is below threshold
 
 
 def main():
@@ -65,20 +117,19 @@ def main():
     args = parser.parse_args()
 
     try:
-        with open(args.file, 'r', encoding='utf-8') as f:
-            text = f.read()
+        data = _map_file(args.file)
     except FileNotFoundError:
         print(f"  page_checker: file not found: {args.file}", file=sys.stderr)
         sys.exit(1)
 
     if args.mode == 'no_discount':
-        should_continue = check_no_discount(text)
+        should_continue = check_no_discount(data)
     elif args.mode == 'seen_before':
         latest = args.latest or ''
         if not latest:
             print("  page_checker: --latest required for seen_before mode", file=sys.stderr)
             sys.exit(1)
-        should_continue = check_seen_before(text, latest, args.threshold)
+        should_continue = check_seen_before(data, latest, args.threshold)
 
     sys.exit(0 if should_continue else 1)
 
@@ -2,15 +2,39 @@
 """Parse SSENSE sale markdown files into structured JSON + self-contained HTML viewer."""
 
 import argparse
-import glob
+import functools
+import hashlib
 import json
+import math
 import os
 import re
 import shutil
+import threading
 import time
 import urllib.request
 import urllib.error
-from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timezone
+
+try:
+    import orjson  # optional: much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data):
+    """Deserialize JSON str/bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # Category keywords (order matters - first match wins)
 CATEGORY_RULES = [
@@ -28,6 +52,12 @@ CATEGORY_RULES = [
                      "watch", "socks", "sock", "beanie", "umbrella"]),
 ]
 
+# One alternation regex per category, tried in CATEGORY_RULES order
+_CATEGORY_RES = [
+    (category, re.compile('|'.join(re.escape(kw) for kw in keywords)))
+    for category, keywords in CATEGORY_RULES
+]
+
 # SSENSE product block regex
 # Format: [![slug - Name](<Base64-Image-Removed>)\\\n\\\nBRAND\\\n\\\n\\\nProduct Name\\\n\\\n\\\n$SALE\\\n\\\n$ORIGINAL](url)
 SSENSE_PRODUCT_RE = re.compile(
@@ -46,95 +76,178 @@ SSENSE_PRODUCT_RE = re.compile(
     re.MULTILINE
 )
 
-def parse_ssense_products_simple(text):
-    """Parse SSENSE markdown by splitting on product link blocks.
+# Lenient SSENSE fallback for blocks SSENSE_PRODUCT_RE does not match
+_SSENSE_BLOCK_SPLIT_RE = re.compile(r'(?=\[!\[)')
+_SSENSE_URL_RE = re.compile(r'\]\((https://www\.ssense\.com/[^\)]+)\)')
+_SSENSE_URL_SUFFIX_RE = re.compile(r'\]\(https://www\.ssense\.com/[^\)]+\)$')
+_PRICE_RE = re.compile(r'^\$([0-9,]+)$')
+
+# Shared block-parsing regexes (compiled once, used per line/block)
+_URL_BRAND_RE = re.compile(r'/product/([^/]+)/')
+# Bounded char classes (which also span newlines) instead of lazy DOTALL .*?;
+# alt text may contain one level of nested [brackets] (unrolled, so linear)
+_IMG_STRIP_RE = re.compile(r'!\[[^\[\]]*(?:\[[^\]]*\][^\[\]]*)*\]\([^)]*\)')
+_LINE_SPLIT_RE = re.compile(r'\\+\s*\n|\\+\s*\\+')
+# Whitespace and line-continuation backslashes trimmed from each split line.
+# Covers everything str.strip() trims (all str.isspace() chars are < U+3001),
+# e.g. NBSP and the ideographic space on 2ndStreet pages.
+_STRIP_CHARS = ''.join(chr(c) for c in range(0x3001) if chr(c).isspace()) + '\\'
+
+_BRACKET_RE = re.compile(r'[\[\]]')
+
+# MR PORTER
+_MRPORTER_URL_RE = re.compile(
+    r'\]\((https://www\.mrporter\.com/[^\)]*?/product/[^\)]+)\)'
+)
+_MRPORTER_IMG_RE = re.compile(r'!\[.*?\]\((https://www\.mrporter\.com/variants/images/[^)]+)\)')
+_MRPORTER_PID_RE = re.compile(r'/product/(?:[^/]+/)+(\d+)$')
+# Non-text block lines (fullmatch): $price (group 1), "50% off", sale badges
+_MRPORTER_NON_TEXT_RE = re.compile(r'\$([0-9,]+)|\d+% off|FINAL SALE|FURTHER REDUCED')
+
+# 2ndStreet
+_2NDST_URL_RE = re.compile(
+    r'\]\((https://en\.2ndstreet\.jp/goods/detail/[^\)]+)\)'
+)
+_2NDST_IMG_RE = re.compile(r'!\[.*?\]\((https://cdn2\.2ndstreet\.jp/img/pc/goods/[^)]+)\)')
+# Classifies a whole block line via lastgroup: "XX% OFF" discount (possibly
+# with leading dash or whitespace), ¥ price (e.g. ¥14,190), or size/condition
+# metadata to skip
+_2NDST_LINE_RE = re.compile(
+    r'(?:(?P<disc>(?i:-?\s*(?P<pct>\d+)%\s*OFF))'
+    r'|(?P<price>[¥￥](?P<yen>[0-9,]+))'
+    r'|(?P<skip>Item Condition:.*|Size\s.*))$',
+    re.DOTALL,
+)
 
-    Each block looks like (with literal \\\\ as line-continuation markers):
-        [![slug - Name](<Base64-Image-Removed>)\\\\
-        \\\\
-        BRAND\\\\
-        \\\\
-        \\\\
-        Product Name\\\\
-        \\\\
-        \\\\
-        $SALE_PRICE\\\\
-        \\\\
-        $ORIGINAL_PRICE](https://www.ssense.com/...)
-    """
-    products = []
-    blocks = re.split(r'(?=\[!\[)', text)
+# Firecrawl
+_FIRECRAWL_KEY_RE = re.compile(r'^export FIRECRAWL_API_KEY="?(fc-[a-f0-9]+)"?')
+# SSENSE productCode appears as a standalone line: 6 digits + letter + 6 digits
+_SSENSE_PRODUCT_CODE_RE = re.compile(r'^\s*(\d{6}[A-Z]\d{6})\s*$', re.MULTILINE)
+
+def _ssense_product(brand, name, sale_price, original_price, url):
+    """Build an SSENSE product dict, inferring brand from the URL if brand == name."""
+    if brand == name:
+        url_brand = _URL_BRAND_RE.search(url)
+        if url_brand:
+            brand = url_brand.group(1).replace('-', ' ').title()
+    return {
+        "brand": brand,
+        "name": name,
+        "sale_price": sale_price,
+        "original_price": original_price,
+        "url": url,
+    }
 
-    for block in blocks:
-        if not block.strip():
-            continue
 
+def _parse_ssense_blocks_lenient(text):
+    """Parse SSENSE product blocks line by line, tolerating layout variations.
+
+    Used for the parts of a page SSENSE_PRODUCT_RE does not match: blocks with
+    single backslashes, CRLF endings, extra lines (badges) or one text line.
+    """
+    products = []
+    for block in _SSENSE_BLOCK_SPLIT_RE.split(text):
         # Extract URL — may be on same line as last price: $680](url)
-        url_match = re.search(r'\]\((https://www\.ssense\.com/[^\)]+)\)', block)
+        url_match = _SSENSE_URL_RE.search(block)
         if not url_match:
             continue
         url = url_match.group(1)
 
-        # Clean lines: strip whitespace and trailing backslashes (literal \\ in file)
+        # Clean lines: strip whitespace and trailing backslashes (literal \\ in file),
+        # then the ](url) suffix if present on a price line
         clean_lines = []
         for line in block.split('\n'):
-            # Strip trailing backslash escapes (file has literal \\)
-            cleaned = line.strip()
-            while cleaned.endswith('\\'):
-                cleaned = cleaned[:-1]
-            cleaned = cleaned.strip()
-            if not cleaned:
-                continue
-            # Remove the ](url) suffix if present on a price line
-            cleaned = re.sub(r'\]\(https://www\.ssense\.com/[^\)]+\)$', '', cleaned)
-            cleaned = cleaned.strip()
+            cleaned = line.strip().rstrip('\\').strip()
+            cleaned = _SSENSE_URL_SUFFIX_RE.sub('', cleaned).strip()
             if cleaned:
                 clean_lines.append(cleaned)
 
         # Filter out image tag line, "SALE ONLY", section headers
-        filtered = []
-        for line in clean_lines:
-            if line.startswith('[!['):
-                continue
-            if line.startswith('#'):
-                continue
-            if line.upper() == 'SALE ONLY':
-                continue
-            filtered.append(line)
+        filtered = [line for line in clean_lines
+                    if not line.startswith(('[![', '#')) and line.upper() != 'SALE ONLY']
 
         # Extract prices (lines matching $NNN)
         prices = []
         text_lines = []
         for line in filtered:
-            price_match = re.match(r'^\$([0-9,]+)$', line)
+            price_match = _PRICE_RE.match(line)
             if price_match:
                 prices.append(int(price_match.group(1).replace(',', '')))
             else:
                 text_lines.append(line)
 
         if len(prices) >= 2 and len(text_lines) >= 1:
-            sale_price = prices[0]
-            original_price = prices[1]
             brand = text_lines[0]
             name = text_lines[1] if len(text_lines) > 1 else text_lines[0]
+            products.append(_ssense_product(brand, name, prices[0], prices[1], url))
 
-            # If brand == name (only one text line), infer brand from URL
-            if brand == name:
-                url_brand = re.search(r'/product/([^/]+)/', url)
-                if url_brand:
-                    brand = url_brand.group(1).replace('-', ' ').title()
+    return products
 
-            products.append({
-                "brand": brand,
-                "name": name,
-                "sale_price": sale_price,
-                "original_price": original_price,
-                "url": url,
-            })
+
+def parse_ssense_products_simple(text):
+    """Parse SSENSE markdown by matching whole product link blocks.
+
+    Each block looks like (with literal \\\\ as line-continuation markers):
+        [![slug - Name](<Base64-Image-Removed>)\\\\
+        \\\\
+        BRAND\\\\
+        \\\\
+        \\\\
+        Product Name\\\\
+        \\\\
+        \\\\
+        $SALE_PRICE\\\\
+        \\\\
+        $ORIGINAL_PRICE](https://www.ssense.com/...)
+
+    Text between regex matches that still holds an SSENSE product link is
+    handed to the lenient line-by-line parser, so layout variations are not
+    silently dropped.
+    """
+    products = []
+    pos = 0
+    for m in SSENSE_PRODUCT_RE.finditer(text):
+        gap = text[pos:m.start()]
+        if '](https://www.ssense.com/' in gap:
+            products.extend(_parse_ssense_blocks_lenient(gap))
+        pos = m.end()
+
+        brand, name, sale_price, original_price, url = m.groups()
+        products.append(_ssense_product(
+            brand.strip(), name.strip(),
+            int(sale_price.replace(',', '')), int(original_price.replace(',', '')),
+            url,
+        ))
+
+    gap = text[pos:]
+    if '](https://www.ssense.com/' in gap:
+        products.extend(_parse_ssense_blocks_lenient(gap))
 
     return products
 
 
+def _iter_product_blocks(text, url_re):
+    """Yield (start, end, url) for each markdown link whose target matches url_re.
+
+    url_re must match from the closing ] of the link text, e.g. ](https://...).
+    Brackets are matched in a single forward pass with a stack of [ positions,
+    so nested image links inside the link text are handled. start/end are the
+    positions of the opening [ and closing ].
+    """
+    stack = []
+    for bracket in _BRACKET_RE.finditer(text):
+        pos = bracket.start()
+        if text[pos] == '[':
+            stack.append(pos)
+            continue
+        if not stack:
+            continue  # unmatched ]
+        start_pos = stack.pop()
+        url_match = url_re.match(text, pos)
+        if url_match:
+            yield start_pos, pos, url_match.group(1)
+
+
 def parse_mrporter_products(text):
     """Parse MR PORTER markdown into product dicts.
 
@@ -144,58 +257,35 @@ def parse_mrporter_products(text):
     """
     products = []
 
-    # Find all product URLs: ](https://www.mrporter.com/.../product/...)
-    url_re = re.compile(
-        r'\]\((https://www\.mrporter\.com/[^\)]*?/product/[^\)]+)\)'
-    )
-
-    for url_match in url_re.finditer(text):
-        url = url_match.group(1)
-        end_pos = url_match.start()  # position of the ] before (url)
-
-        # Walk backwards to find the matching [ bracket
-        depth = 1
-        pos = end_pos - 1
-        while pos >= 0 and depth > 0:
-            if text[pos] == ']':
-                depth += 1
-            elif text[pos] == '[':
-                depth -= 1
-            pos -= 1
-        if depth != 0:
-            continue
-        start_pos = pos + 1  # position of the opening [
-
+    # Find all product links: [...](https://www.mrporter.com/.../product/...)
+    for start_pos, end_pos, url in _iter_product_blocks(text, _MRPORTER_URL_RE):
         raw_content = text[start_pos + 1:end_pos]  # content between [ and ]
 
         # Extract image URL before stripping
-        img_match = re.search(r'!\[.*?\]\((https://www\.mrporter\.com/variants/images/[^)]+)\)', raw_content)
+        img_match = _MRPORTER_IMG_RE.search(raw_content)
         image_url = img_match.group(1) if img_match else None
 
         # Strip image tags from content
-        raw_content = re.sub(r'!\[.*?\]\(.*?\)', '', raw_content, flags=re.DOTALL)
+        raw_content = _IMG_STRIP_RE.sub('', raw_content)
 
         # Clean: split on \\+newline, strip backslashes and whitespace
-        lines = re.split(r'\\+\s*\n|\\+\s*\\+', raw_content)
+        lines = _LINE_SPLIT_RE.split(raw_content)
         clean = []
         for line in lines:
-            s = line.strip().strip('\\').strip()
+            s = line.strip(_STRIP_CHARS)
             if s:
                 clean.append(s)
 
-        # Extract prices and text lines
+        # Extract prices and text lines: one regex call classifies each line
         prices = []
         text_lines = []
         for line in clean:
-            price_m = re.match(r'^\$([0-9,]+)$', line)
-            if price_m:
-                prices.append(int(price_m.group(1).replace(',', '')))
-            elif re.match(r'^\d+% off$', line):
-                continue  # skip "50% off" lines
-            elif line in ('FINAL SALE', 'FURTHER REDUCED'):
-                continue
-            else:
+            m = _MRPORTER_NON_TEXT_RE.fullmatch(line)
+            if not m:
                 text_lines.append(line)
+            elif m.group(1):
+                prices.append(int(m.group(1).replace(',', '')))
+            # else: "50% off" or sale badge line, skipped
 
         # Need at least 2 prices (original + sale) and 1 text line (brand)
         if len(prices) < 2 or len(text_lines) < 1:
@@ -210,7 +300,7 @@ def parse_mrporter_products(text):
 
         # Fallback: construct image URL from product ID in URL
         if not image_url:
-            pid_match = re.search(r'/product/(?:[^/]+/)+(\d+)$', url)
+            pid_match = _MRPORTER_PID_RE.search(url)
             if pid_match:
                 image_url = f"https://www.mrporter.com/variants/images/{pid_match.group(1)}/in/w358_q60.jpg"
 
@@ -236,42 +326,22 @@ def parse_2ndstreet_products(text):
     """
     products = []
 
-    # Find all product URLs
-    url_re = re.compile(
-        r'\]\((https://en\.2ndstreet\.jp/goods/detail/[^\)]+)\)'
-    )
-
-    for url_match in url_re.finditer(text):
-        url = url_match.group(1)
-        end_pos = url_match.start()  # position of ] before (url)
-
-        # Walk backwards to find matching [ bracket
-        depth = 1
-        pos = end_pos - 1
-        while pos >= 0 and depth > 0:
-            if text[pos] == ']':
-                depth += 1
-            elif text[pos] == '[':
-                depth -= 1
-            pos -= 1
-        if depth != 0:
-            continue
-        start_pos = pos + 1  # position of opening [
-
+    # Find all product links: [...](https://en.2ndstreet.jp/goods/detail/...)
+    for start_pos, end_pos, url in _iter_product_blocks(text, _2NDST_URL_RE):
         raw_content = text[start_pos + 1:end_pos]  # content between [ and ]
 
         # Extract image URL before stripping — use full-size instead of thumbnail
-        img_match = re.search(r'!\[.*?\]\((https://cdn2\.2ndstreet\.jp/img/pc/goods/[^)]+)\)', raw_content)
+        img_match = _2NDST_IMG_RE.search(raw_content)
         image_url = img_match.group(1).replace('_tn.jpg', '.jpg') if img_match else None
 
         # Strip image tags from content
-        raw_content = re.sub(r'!\[.*?\]\(.*?\)', '', raw_content, flags=re.DOTALL)
+        raw_content = _IMG_STRIP_RE.sub('', raw_content)
 
         # Clean: split on \\+newline, strip backslashes and whitespace
-        lines = re.split(r'\\+\s*\n|\\+\s*\\+', raw_content)
+        lines = _LINE_SPLIT_RE.split(raw_content)
         clean = []
         for line in lines:
-            s = line.strip().strip('\\').strip()
+            s = line.strip(_STRIP_CHARS)
             # Strip markdown list prefix "- "
             if s.startswith('- '):
                 s = s[2:].strip()
@@ -284,25 +354,14 @@ def parse_2ndstreet_products(text):
         text_lines = []
 
         for line in clean:
-            # Match "XX% OFF" (possibly with leading dash or whitespace)
-            disc_m = re.match(r'^-?\s*(\d+)%\s*OFF$', line, re.IGNORECASE)
-            if disc_m:
-                discount_pct = int(disc_m.group(1))
-                continue
-
-            # Match ¥ price (e.g. ¥14,190)
-            price_m = re.match(r'^[¥￥]([0-9,]+)$', line)
-            if price_m:
-                price = int(price_m.group(1).replace(',', ''))
-                continue
-
-            # Skip condition/size metadata lines
-            if line.startswith('Item Condition:'):
-                continue
-            if re.match(r'^Size\s', line):
-                continue
-
-            text_lines.append(line)
+            m = _2NDST_LINE_RE.match(line)
+            if not m:
+                text_lines.append(line)
+            elif m.lastgroup == 'disc':
+                discount_pct = int(m.group('pct'))
+            elif m.lastgroup == 'price':
+                price = int(m.group('yen').replace(',', ''))
+            # else: condition/size metadata line, skipped
 
         if price is None or len(text_lines) < 1:
             continue
@@ -331,26 +390,42 @@ def parse_2ndstreet_products(text):
     return products
 
 
+# Retailer (filename prefix) -> parser; anything else is parsed as SSENSE
+_RETAILER_PARSERS = {
+    '2ndstreet': parse_2ndstreet_products,
+    'mrporter': parse_mrporter_products,
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def infer_category(product_name):
     """Infer product category from name keywords."""
     name_lower = product_name.lower()
-    for category, keywords in CATEGORY_RULES:
-        for kw in keywords:
-            if kw in name_lower:
-                return category
+    for category, keyword_re in _CATEGORY_RES:
+        if keyword_re.search(name_lower):
+            return category
     return "other"
 
 
+# How much of each file to read before deciding whether it has products at all
+PARSE_HEAD_BYTES = 64 * 1024
+
+
 def parse_file(filepath):
     """Parse a single markdown file and return list of product dicts."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        text = f.read()
-
-    # Skip "no sale products" pages
-    if 'no sale products to display' in text.lower():
+    # Skip very small files (anti-bot blocks, empty pages) before reading them
+    if os.path.getsize(filepath) < 500:
         return []
 
-    # Skip very small files (anti-bot blocks, empty pages)
+    with open(filepath, 'rb') as f:
+        head = f.read(PARSE_HEAD_BYTES)
+        # Skip "no sale products" pages — the notice sits near the top
+        if b'no sale products to display' in head.lower():
+            return []
+        # Binary reads skip text mode's newline translation, so normalise here
+        text = (head + f.read()).decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+    # Size in bytes can exceed length in characters for non-ASCII pages
     if len(text) < 500:
         return []
 
@@ -358,12 +433,8 @@ def parse_file(filepath):
     basename = os.path.basename(filepath)
     retailer = basename.split('_')[0] if '_' in basename else 'unknown'
 
-    if retailer == '2ndstreet':
-        products = parse_2ndstreet_products(text)
-    elif retailer == 'mrporter':
-        products = parse_mrporter_products(text)
-    else:
-        products = parse_ssense_products_simple(text)
+    parser = _RETAILER_PARSERS.get(retailer, parse_ssense_products_simple)
+    products = parser(text)
 
     # Enrich each product
     for p in products:
@@ -382,6 +453,30 @@ def parse_file(filepath):
     return products
 
 
+# Parallel parsing only pays off once there is enough markdown to outweigh
+# worker startup (~150 ms with spawn, the macOS default; a typical ~35-page
+# run is well under 1 MB and parses serially in ~10 ms)
+PARALLEL_PARSE_MIN_BYTES = 8 * 1024 * 1024
+PARALLEL_PARSE_CHUNKSIZE = 4
+
+
+def parse_files(md_files):
+    """Parse markdown files, yielding each file's products in order.
+
+    Files are independent, so large inputs fan out over a process pool. Small
+    inputs and single-CPU machines parse in-process since worker startup
+    would cost more than it saves.
+    """
+    cpus = os.cpu_count() or 1
+    total_bytes = sum(os.path.getsize(path) for path in md_files)
+    if cpus == 1 or total_bytes < PARALLEL_PARSE_MIN_BYTES:
+        yield from map(parse_file, md_files)
+        return
+    workers = min(cpus, math.ceil(len(md_files) / PARALLEL_PARSE_CHUNKSIZE))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        yield from ex.map(parse_file, md_files, chunksize=PARALLEL_PARSE_CHUNKSIZE)
+
+
 def load_preferences(prefs_path=None):
     """Load preferences from config file."""
     if prefs_path is None:
@@ -410,10 +505,41 @@ def _load_cortex_state():
 
 
 SSENSE_IMAGE_CACHE_PATH = os.path.expanduser('~/CLAUDE/sale-monitor/cache/ssense_images.json')
+JPY_USD_RATE_CACHE_PATH = os.path.expanduser('~/CLAUDE/sale-monitor/cache/jpy_usd_rate.json')
+
+# Firecrawl product-page fetches: concurrent requests, request rate, and how
+# often to checkpoint the image cache while fetching
+SSENSE_FETCH_WORKERS = 6
+SSENSE_FETCH_MAX_RPS = 4
+SSENSE_CACHE_SAVE_EVERY = 10
+
+
+def _load_cached_jpy_usd_rate():
+    """Return the cached {"date", "rate"} entry, or None if missing/unreadable/invalid."""
+    try:
+        with open(JPY_USD_RATE_CACHE_PATH, 'rb') as f:
+            cached = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    # Guard against hand-edited or partial cache files
+    if not (isinstance(cached, dict) and isinstance(cached.get('rate'), (int, float))):
+        return None
+    return cached
 
 
 def fetch_jpy_usd_rate():
-    """Fetch current JPY→USD exchange rate from frankfurter.app (free, no key)."""
+    """Fetch current JPY→USD exchange rate from frankfurter.app (free, no key).
+
+    Rates change at most daily, so the rate is cached on disk and reused for
+    the rest of the day. A stale cached rate is used if the fetch fails.
+    """
+    today = date.today().isoformat()
+    cached = _load_cached_jpy_usd_rate()
+    if cached and cached.get('date') == today:
+        rate = cached['rate']
+        print(f'  JPY→USD rate: {rate} (1 JPY = ${rate}, cached)')
+        return rate
+
     try:
         req = urllib.request.Request(
             'https://api.frankfurter.app/latest?from=JPY&to=USD',
@@ -422,12 +548,23 @@ def fetch_jpy_usd_rate():
         with urllib.request.urlopen(req, timeout=10) as resp:
             data = json.loads(resp.read())
         rate = data['rates']['USD']
-        print(f'  JPY→USD rate: {rate} (1 JPY = ${rate})')
-        return rate
     except Exception as e:
+        if cached and cached.get('rate'):
+            print(f'  Warning: could not fetch JPY→USD rate: {e}; '
+                  f'using cached rate from {cached.get("date")}')
+            return cached['rate']
         print(f'  Warning: could not fetch JPY→USD rate: {e}')
         return None
 
+    print(f'  JPY→USD rate: {rate} (1 JPY = ${rate})')
+    try:
+        os.makedirs(os.path.dirname(JPY_USD_RATE_CACHE_PATH), exist_ok=True)
+        with open(JPY_USD_RATE_CACHE_PATH, 'wb') as f:
+            f.write(_json_dumps({"date": today, "rate": rate}, indent=True))
+    except OSError as e:
+        print(f'  Warning: could not cache JPY→USD rate: {e}')
+    return rate
+
 
 def convert_jpy_to_usd(products, rate):
     """Convert JPY-denominated products to USD, preserving original prices."""
@@ -455,7 +592,7 @@ def _load_firecrawl_key():
         if os.path.exists(path):
             with open(path) as f:
                 for line in f:
-                    m = re.match(r'^export FIRECRAWL_API_KEY="?(fc-[a-f0-9]+)"?', line)
+                    m = _FIRECRAWL_KEY_RE.match(line)
                     if m:
                         return m.group(1)
     return ''
@@ -483,14 +620,39 @@ def _fetch_ssense_product_code(url, api_key):
         with urllib.request.urlopen(req, timeout=30) as resp:
             body = json.loads(resp.read())
         md = body.get('data', {}).get('markdown', '')
-        # productCode appears as a standalone line: 6 digits + letter + 6 digits
-        m = re.search(r'^\s*(\d{6}[A-Z]\d{6})\s*$', md, re.MULTILINE)
+        m = _SSENSE_PRODUCT_CODE_RE.search(md)
         return m.group(1) if m else None
     except Exception as e:
         print(f'    Warning: Firecrawl request failed for {url}: {e}')
         return None
 
 
+def _rate_limited(fn, max_per_sec):
+    """Wrap fn so that calls from any thread start at most max_per_sec times per second."""
+    lock = threading.Lock()
+    interval = 1.0 / max_per_sec
+    next_start = time.monotonic()
+
+    def wrapper(*args):
+        nonlocal next_start
+        with lock:
+            now = time.monotonic()
+            start = max(now, next_start)
+            next_start = start + interval
+        if start > now:
+            time.sleep(start - now)
+        return fn(*args)
+
+    return wrapper
+
+
+def _save_ssense_image_cache(cache):
+    """Write the SSENSE image cache to disk."""
+    os.makedirs(os.path.dirname(SSENSE_IMAGE_CACHE_PATH), exist_ok=True)
+    with open(SSENSE_IMAGE_CACHE_PATH, 'wb') as f:
+        f.write(_json_dumps(cache, indent=True))
+
+
 def resolve_ssense_images(products):
     """Resolve image URLs for SSENSE products using a persistent cache.
 
@@ -506,8 +668,8 @@ def resolve_ssense_images(products):
     # Load cache
     cache = {}
     if os.path.exists(SSENSE_IMAGE_CACHE_PATH):
-        with open(SSENSE_IMAGE_CACHE_PATH) as f:
-            cache = json.load(f)
+        with open(SSENSE_IMAGE_CACHE_PATH, 'rb') as f:
+            cache = _json_loads(f.read())
 
     # Check cache first
     to_fetch = []
@@ -532,28 +694,37 @@ def resolve_ssense_images(products):
         return
 
     print(f'  SSENSE images: fetching {len(to_fetch)} product pages...')
+    fetch_code = _rate_limited(_fetch_ssense_product_code, SSENSE_FETCH_MAX_RPS)
     fetched = 0
-    for i, (p, pid) in enumerate(to_fetch):
-        code = _fetch_ssense_product_code(p['url'], api_key)
-        if code:
-            image_url = f'https://img.ssensemedia.com/images/{code}_1/x.jpg'
-            p['image_url'] = image_url
-            cache[pid] = image_url
-            fetched += 1
-            print(f'    [{i+1}/{len(to_fetch)}] {pid} -> {code}')
-        else:
-            print(f'    [{i+1}/{len(to_fetch)}] {pid} -> no productCode found')
-        # Small delay between requests
-        if i < len(to_fetch) - 1:
-            time.sleep(0.5)
+    ex = ThreadPoolExecutor(max_workers=SSENSE_FETCH_WORKERS)
+    interrupted = True
+    try:
+        futures = {ex.submit(fetch_code, p['url'], api_key): (p, pid) for p, pid in to_fetch}
+        for i, fut in enumerate(as_completed(futures)):
+            p, pid = futures[fut]
+            code = fut.result()
+            if code:
+                image_url = f'https://img.ssensemedia.com/images/{code}_1/x.jpg'
+                p['image_url'] = image_url
+                cache[pid] = image_url
+                fetched += 1
+                print(f'    [{i+1}/{len(to_fetch)}] {pid} -> {code}')
+            else:
+                print(f'    [{i+1}/{len(to_fetch)}] {pid} -> no productCode found')
+            # Checkpoint so an interrupted run keeps what it already resolved
+            if code and fetched % SSENSE_CACHE_SAVE_EVERY == 0:
+                _save_ssense_image_cache(cache)
+        interrupted = False
+    finally:
+        if interrupted:
+            # Ctrl-C or error: drop queued requests instead of paying for them all
+            ex.shutdown(wait=False, cancel_futures=True)
+        # Save updated cache (before waiting on any in-flight requests)
+        _save_ssense_image_cache(cache)
+        ex.shutdown()
 
     print(f'  SSENSE images: {fetched}/{len(to_fetch)} resolved')
 
-    # Save updated cache
-    os.makedirs(os.path.dirname(SSENSE_IMAGE_CACHE_PATH), exist_ok=True)
-    with open(SSENSE_IMAGE_CACHE_PATH, 'w') as f:
-        json.dump(cache, f, indent=2)
-
 
 def main():
     parser = argparse.ArgumentParser(description='Parse SSENSE sale markdown into JSON')
@@ -579,37 +750,39 @@ def main():
     min_discount = args.min_discount or prefs.get('min_discount_pct', 50)
 
     # Find all markdown files
-    md_files = sorted(glob.glob(os.path.join(input_dir, '*.md')))
+    md_files = []
+    if os.path.isdir(input_dir):
+        md_files = sorted(
+            entry.path for entry in os.scandir(input_dir)
+            if entry.name.endswith('.md') and not entry.name.startswith('.') and entry.is_file()
+        )
     if not md_files:
         print(f'No .md files found in {input_dir}')
         return
 
     print(f'Parsing {len(md_files)} files from {input_dir}...')
 
-    # Parse all files
-    all_products = []
+    # Parse all files, deduplicating by URL (p2 often repeats p1) and filtering
+    # by discount threshold (secondhand items always pass) in a single pass.
+    # The first occurrence of a URL wins, even if it is then filtered out.
+    total_parsed = 0
+    seen_urls = set()
+    filtered = []
     retailers = set()
-    for filepath in md_files:
-        products = parse_file(filepath)
-        all_products.extend(products)
+    for products in parse_files(md_files):
+        total_parsed += len(products)
         if products:
             retailers.add(products[0]['retailer'])
-
-    print(f'  Total products parsed: {len(all_products)}')
-
-    # Deduplicate by URL (p2 often repeats p1)
-    seen_urls = set()
-    unique_products = []
-    for p in all_products:
-        if p['url'] not in seen_urls:
+        for p in products:
+            if p['url'] in seen_urls:
+                continue
             seen_urls.add(p['url'])
-            unique_products.append(p)
+            if p.get('retailer_type') == 'secondhand' or p['discount_pct'] >= min_discount:
+                filtered.append(p)
 
-    print(f'  After dedup: {len(unique_products)}')
+    print(f'  Total products parsed: {total_parsed}')
+    print(f'  After dedup: {len(seen_urls)}')
 
-    # Filter by discount threshold (secondhand items always pass)
-    filtered = [p for p in unique_products
-                if p.get('retailer_type') == 'secondhand' or p['discount_pct'] >= min_discount]
     filtered.sort(key=lambda p: p['discount_pct'], reverse=True)
 
     print(f'  After filtering (>={min_discount}% off): {len(filtered)}')
@@ -639,7 +812,7 @@ def main():
     meta = {
         "scraped_at": timestamp,
         "retailers": sorted(retailers),
-        "total_parsed": len(unique_products),
+        "total_parsed": len(seen_urls),
         "total_filtered": len(filtered),
         "min_discount_pct": min_discount,
     }
@@ -651,48 +824,103 @@ def main():
         "products": filtered,
     }
 
+    # Skip all writes if nothing but the timestamp changed since the last run
+    latest_path = os.path.join(output_dir, 'latest.json')
+    deals_path = os.path.join(viewer_dir, 'deals.html')
+    content_hash = _content_hash(result)
+    if _read_content_hash(latest_path) == content_hash:
+        print(f'  No changes since {os.path.realpath(latest_path)}, skipping writes')
+        # The viewer template may still have changed; rebuild from the unchanged data
+        if _deals_html_stale(viewer_dir):
+            with open(latest_path, 'rb') as f:
+                generate_deals_html(f.read(), viewer_dir)
+            print(f'  Wrote {deals_path}')
+        print(f'\nDone! {len(filtered)} deals ready.')
+        print(f'  Open: {deals_path}')
+        return
+    meta["content_hash"] = content_hash
+
+    # Serialize once; the same bytes go to disk and into deals.html
+    payload = _json_dumps(result, indent=True)
+
     # Write timestamped JSON
     os.makedirs(output_dir, exist_ok=True)
     json_path = os.path.join(output_dir, f'{file_timestamp}.json')
-    with open(json_path, 'w') as f:
-        json.dump(result, f, indent=2)
+    with open(json_path, 'wb') as f:
+        f.write(payload)
     print(f'  Wrote {json_path}')
 
-    # Update latest.json symlink
-    latest_path = os.path.join(output_dir, 'latest.json')
-    if os.path.islink(latest_path) or os.path.exists(latest_path):
-        os.remove(latest_path)
-    os.symlink(os.path.basename(json_path), latest_path)
+    # Update latest.json symlink atomically: build it aside, then rename over
+    tmp_link = latest_path + '.tmp'
+    if os.path.lexists(tmp_link):
+        os.remove(tmp_link)
+    os.symlink(os.path.basename(json_path), tmp_link)
+    os.replace(tmp_link, latest_path)
     print(f'  Updated {latest_path} -> {os.path.basename(json_path)}')
 
     # Generate self-contained deals.html
-    generate_deals_html(result, viewer_dir)
-    print(f'  Wrote {os.path.join(viewer_dir, "deals.html")}')
+    generate_deals_html(payload, viewer_dir)
+    print(f'  Wrote {deals_path}')
 
     print(f'\nDone! {len(filtered)} deals ready.')
-    print(f'  Open: {os.path.join(viewer_dir, "deals.html")}')
+    print(f'  Open: {deals_path}')
+
+
+_CONTENT_HASH_RE = re.compile(rb'"content_hash":\s*"([0-9a-f]{64})"')
+
+
+def _content_hash(result):
+    """Hash a result's meta and products, ignoring the scraped_at timestamp."""
+    meta = {k: v for k, v in result['meta'].items() if k != 'scraped_at'}
+    return hashlib.sha256(_json_dumps({"meta": meta, "products": result['products']})).hexdigest()
+
+
+def _read_content_hash(json_path):
+    """Return the content_hash stored in a result file's meta, or None.
+
+    meta is written first, so only the head of the file needs reading.
+    """
+    try:
+        with open(json_path, 'rb') as f:
+            head = f.read(4096)
+    except OSError:
+        return None
+    m = _CONTENT_HASH_RE.search(head)
+    return m.group(1).decode() if m else None
 
 
-def generate_deals_html(data, viewer_dir):
-    """Generate a self-contained HTML file with inlined JSON data."""
+def _deals_html_stale(viewer_dir):
+    """Return True if deals.html is missing or older than the index.html template."""
+    template_path = os.path.join(viewer_dir, 'index.html')
+    deals_path = os.path.join(viewer_dir, 'deals.html')
+    if not os.path.exists(deals_path):
+        return True
+    return os.path.exists(template_path) and os.path.getmtime(template_path) > os.path.getmtime(deals_path)
+
+
+def generate_deals_html(payload, viewer_dir):
+    """Generate a self-contained HTML file with inlined JSON data.
+
+    payload is the already-serialized result JSON (UTF-8 bytes).
+    """
     # Read the template
     template_path = os.path.join(viewer_dir, 'index.html')
     if not os.path.exists(template_path):
         print(f'  Warning: {template_path} not found, skipping deals.html generation')
         return
 
-    with open(template_path, 'r') as f:
+    with open(template_path, 'rb') as f:
         template = f.read()
 
     # Inject data by replacing the placeholder
-    json_str = json.dumps(data)
     html = template.replace(
-        'const EMBEDDED_DATA = null;',
-        f'const EMBEDDED_DATA = {json_str};'
+        b'const EMBEDDED_DATA = null;',
+        b'const EMBEDDED_DATA = ' + payload + b';',
+        1,
     )
 
     deals_path = os.path.join(viewer_dir, 'deals.html')
-    with open(deals_path, 'w') as f:
+    with open(deals_path, 'wb') as f:
         f.write(html)
 
 
@@ -0,0 +1,78 @@
+"""Tests for the bytes regexes in scripts/page_checker.py."""
+
+import os
+import contextlib
+import io
+import re
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import page_checker  # noqa: E402
+from page_checker import _2NDST_URL_FIND_RE, _DISCOUNT_FIND_RE  # noqa: E402
+
+# The original str patterns, whose Unicode-aware \s the bytes patterns must match
+STR_DISCOUNT_RE = re.compile(r'\d+%\s*OFF', re.IGNORECASE)
+STR_URL_RE = re.compile(r'https://en\.2ndstreet\.jp/goods/detail/[^\s\)\]]+')
+
+URL = 'https://en.2ndstreet.jp/goods/detail/goodsId/2330001/shopsId/31234'
+WHITESPACE = [chr(c) for c in range(0x3001) if chr(c).isspace()]
+
+
+class TestBytesPatternsMatchStrPatterns(unittest.TestCase):
+
+    def test_discount_with_any_whitespace(self):
+        for ws in WHITESPACE:
+            text = f'-50%{ws}OFF and 30%{ws}{ws}off'
+            with self.subTest(ws=hex(ord(ws))):
+                self.assertEqual(len(_DISCOUNT_FIND_RE.findall(text.encode('utf-8'))),
+                                 len(STR_DISCOUNT_RE.findall(text)))
+
+    def test_discount_with_full_width_digits(self):
+        for text in ['５０%OFF', '-３０% off', '1０%\u3000OFF']:
+            with self.subTest(text=text):
+                self.assertEqual(len(_DISCOUNT_FIND_RE.findall(text.encode('utf-8'))),
+                                 len(STR_DISCOUNT_RE.findall(text)))
+                self.assertEqual(len(STR_DISCOUNT_RE.findall(text)), 1)
+
+    def test_url_ends_at_any_whitespace(self):
+        for ws in WHITESPACE:
+            text = f'[x]({URL}) {URL}{ws}¥1,000'
+            with self.subTest(ws=hex(ord(ws))):
+                found = [u.decode('utf-8') for u in _2NDST_URL_FIND_RE.findall(text.encode('utf-8'))]
+                self.assertEqual(found, STR_URL_RE.findall(text))
+
+    def test_url_keeps_non_whitespace_utf8(self):
+        text = f'{URL}/名前 next'
+        found = [u.decode('utf-8') for u in _2NDST_URL_FIND_RE.findall(text.encode('utf-8'))]
+        self.assertEqual(found, STR_URL_RE.findall(text))
+
+
+class TestLoadKnownUrlsRegexFallback(unittest.TestCase):
+
+    def check(self, content):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'latest.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            stderr = io.StringIO()
+            with mock.patch.object(page_checker, 'ijson', None), contextlib.redirect_stderr(stderr):
+                should_continue = page_checker.check_seen_before(URL.encode(), path, 0.5)
+        return should_continue, stderr.getvalue()
+
+    def test_complete_file(self):
+        should_continue, log = self.check('{"meta": {}, "products": [{"url": "%s"}]}\n' % URL)
+        self.assertFalse(should_continue)
+        self.assertIn('1/1 checked URLs already known', log)
+
+    def test_truncated_file_reports_could_not_load(self):
+        should_continue, log = self.check('{"meta": {}, "products": [{"url": "%s"}, {"ur' % URL)
+        self.assertTrue(should_continue)
+        self.assertIn('could not load', log)
+
+
+if __name__ == '__main__':
+    unittest.main()
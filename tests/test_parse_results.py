@@ -0,0 +1,196 @@
+"""Regression tests for the markdown parsers in scripts/parse_results.py."""
+
+import os
+import re
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import parse_results  # noqa: E402
+from parse_results import (  # noqa: E402
+    parse_2ndstreet_products,
+    parse_file,
+    parse_mrporter_products,
+    parse_ssense_products_simple,
+)
+
+
+def baseline_parse_ssense(text):
+    """The original parse_ssense_products_simple, kept as the reference behaviour."""
+    products = []
+    for block in re.split(r'(?=\[!\[)', text):
+        if not block.strip():
+            continue
+        url_match = re.search(r'\]\((https://www\.ssense\.com/[^\)]+)\)', block)
+        if not url_match:
+            continue
+        url = url_match.group(1)
+        clean_lines = []
+        for line in block.split('\n'):
+            cleaned = line.strip()
+            while cleaned.endswith('\\'):
+                cleaned = cleaned[:-1]
+            cleaned = cleaned.strip()
+            if not cleaned:
+                continue
+            cleaned = re.sub(r'\]\(https://www\.ssense\.com/[^\)]+\)$', '', cleaned)
+            cleaned = cleaned.strip()
+            if cleaned:
+                clean_lines.append(cleaned)
+        filtered = [line for line in clean_lines
+                    if not line.startswith('[![') and not line.startswith('#')
+                    and line.upper() != 'SALE ONLY']
+        prices = []
+        text_lines = []
+        for line in filtered:
+            price_match = re.match(r'^\$([0-9,]+)$', line)
+            if price_match:
+                prices.append(int(price_match.group(1).replace(',', '')))
+            else:
+                text_lines.append(line)
+        if len(prices) >= 2 and len(text_lines) >= 1:
+            brand = text_lines[0]
+            name = text_lines[1] if len(text_lines) > 1 else text_lines[0]
+            if brand == name:
+                url_brand = re.search(r'/product/([^/]+)/', url)
+                if url_brand:
+                    brand = url_brand.group(1).replace('-', ' ').title()
+            products.append({
+                "brand": brand,
+                "name": name,
+                "sale_price": prices[0],
+                "original_price": prices[1],
+                "url": url,
+            })
+    return products
+
+
+URL = 'https://www.ssense.com/en-us/men/product/rick-owens/black-boots/{}'
+
+
+def block(lines, n, sep='\\\\\n'):
+    """Join block lines with the given continuation separator and close the link."""
+    return '[![rick-owens - Black Boots](<Base64-Image-Removed>)' + sep + sep.join(lines) + f']({URL.format(n)})\n\n'
+
+
+CANONICAL = ['', 'RICK OWENS', '', '', 'Black Boots', '', '', '$500', '', '$1,200']
+
+
+class TestParseSsenseDifferential(unittest.TestCase):
+
+    def assertMatchesBaseline(self, text, expected_count):
+        products = parse_ssense_products_simple(text)
+        self.assertEqual(products, baseline_parse_ssense(text))
+        self.assertEqual(len(products), expected_count)
+
+    def test_canonical_block(self):
+        self.assertMatchesBaseline(block(CANONICAL, 1), 1)
+
+    def test_single_backslash_separators(self):
+        self.assertMatchesBaseline(block(CANONICAL, 1, sep='\\\n'), 1)
+
+    def test_extra_badge_line(self):
+        lines = CANONICAL[:7] + ['SALE ONLY', 'Final Sale'] + CANONICAL[7:]
+        self.assertMatchesBaseline(block(lines, 1), 1)
+
+    def test_crlf_line_endings(self):
+        self.assertMatchesBaseline(block(CANONICAL, 1).replace('\n', '\r\n'), 1)
+
+    def test_single_text_line_uses_url_brand(self):
+        lines = ['', 'Black Boots', '', '', '$500', '', '$1,200']
+        products = parse_ssense_products_simple(block(lines, 1))
+        self.assertEqual(products[0]['brand'], 'Rick Owens')
+        self.assertMatchesBaseline(block(lines, 1), 1)
+
+    def test_trailing_spaces_stripped(self):
+        lines = ['', 'RICK OWENS ', '', '', 'Black Boots  ', '', '', '$500', '', '$1,200']
+        self.assertMatchesBaseline(block(lines, 1), 1)
+
+    def test_mixed_page_keeps_order(self):
+        text = ('# Sale\nSALE ONLY\n'
+                + block(CANONICAL, 1)
+                + block(CANONICAL, 2, sep='\\\n')
+                + block(CANONICAL, 3)
+                + block(['', 'Black Boots', '', '', '$500', '', '$1,200'], 4)
+                + '[Next](https://www.ssense.com/en-us/sale?page=2)\n')
+        self.assertMatchesBaseline(text, 4)
+
+
+SEP = '\\\\\n'
+MRPORTER_URL = 'https://www.mrporter.com/en-us/mens/product/sacai/clothing/wool-coat/123'
+SECOND_URL = 'https://en.2ndstreet.jp/goods/detail/goodsId/1/shopsId/2'
+
+
+def mrporter_block(lines, img='![Wool Coat](https://www.mrporter.com/variants/images/123/in/w358_q60.jpg)'):
+    return '- [' + img + SEP + SEP.join(lines) + f']({MRPORTER_URL})\n'
+
+
+def second_block(lines):
+    return ('- [![img](https://cdn2.2ndstreet.jp/img/pc/goods/1_tn.jpg)' + SEP
+            + SEP.join(lines) + f']({SECOND_URL})\n')
+
+
+class TestUnicodeWhitespace(unittest.TestCase):
+
+    def test_mrporter_price_with_nbsp(self):
+        text = mrporter_block(['SACAI', 'Wool Coat', '$1,000\xa0', '50% off', '$500'])
+        products = parse_mrporter_products(text)
+        self.assertEqual(len(products), 1)
+        self.assertEqual((products[0]['original_price'], products[0]['sale_price']), (1000, 500))
+
+    def test_2ndstreet_price_with_ideographic_space(self):
+        text = second_block(['Sacai', 'Wool Coat', 'Size M', '¥1,000\u3000'])
+        products = parse_2ndstreet_products(text)
+        self.assertEqual(len(products), 1)
+        self.assertEqual(products[0]['sale_price'], 1000)
+
+
+class TestMrporterLineClassification(unittest.TestCase):
+
+    def test_bare_newline_keeps_line_whole(self):
+        url = 'https://www.mrporter.com/en-us/mens/product/x/0'
+        self.assertEqual(parse_mrporter_products(f'[[$1,000\n#FINAL SALE\n$1,000]({url})'), [])
+
+    def test_badge_and_percent_lines_skipped(self):
+        text = mrporter_block(['FINAL SALE', 'SACAI', 'Wool Coat', '$1,000', '50% off', '$500'])
+        products = parse_mrporter_products(text)
+        self.assertEqual((products[0]['brand'], products[0]['name']), ('SACAI', 'Wool Coat'))
+        self.assertEqual((products[0]['original_price'], products[0]['sale_price']), (1000, 500))
+
+
+class TestImageStrip(unittest.TestCase):
+
+    def test_mrporter_image_alt_with_brackets(self):
+        img = '![Wool Coat [Navy]](https://www.mrporter.com/variants/images/123/in/w358_q60.jpg)'
+        text = mrporter_block(['SACAI', 'Wool Coat', '$1,000', '50% off', '$500'], img=img)
+        products = parse_mrporter_products(text)
+        self.assertEqual(len(products), 1)
+        self.assertEqual((products[0]['brand'], products[0]['name']), ('SACAI', 'Wool Coat'))
+
+
+class TestParseFile(unittest.TestCase):
+
+    def test_crlf_file_normalised(self):
+        text = ''.join(block(CANONICAL, n) for n in range(5)).replace('\n', '\r\n')
+        seen = []
+
+        def spy(page):
+            seen.append(page)
+            return parse_ssense_products_simple(page)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'ssense_men_p1.md')
+            with open(path, 'wb') as f:
+                f.write(text.encode('utf-8'))
+            with mock.patch.dict(parse_results._RETAILER_PARSERS, {'ssense': spy}):
+                products = parse_file(path)
+        self.assertNotIn('\r', seen[0])
+        self.assertEqual(len(products), 5)
+        self.assertEqual(products[0]['brand'], 'RICK OWENS')
+
+
+if __name__ == '__main__':
+    unittest.main()